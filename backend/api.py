@@ -1,18 +1,46 @@
 """Flask API routes and application setup."""
+import base64
 import os
+from datetime import datetime
+from typing import Any, Iterator
 
-from flask import Flask, request
+import orjson
+from flask import Flask, Response, request, stream_with_context
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
 from pydantic import ValidationError
+from sqlalchemy.exc import IntegrityError
 
 from auth import generate_token, login_required, validate_request_json
 from models import Rca, User, WhyNode, db
-from schemas import (LoginRequest, RcaCreateRequest, RcaUpdateRequest,
-                     RegisterRequest, WhyNodeCreateRequest,
-                     WhyNodeUpdateRequest)
+from schemas import (LOGIN_ADAPTER, RCA_CREATE_ADAPTER, RCA_UPDATE_ADAPTER,
+                     REGISTER_ADAPTER, WHY_NODE_BULK_CREATE_ADAPTER,
+                     WHY_NODE_CREATE_ADAPTER, WHY_NODE_UPDATE_ADAPTER)
+
+# Render naive datetimes as UTC with a Z suffix
+_ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson's native (Rust) encoder.
+
+    Serializes datetimes directly (naive values are treated as UTC and
+    rendered with a Z suffix), so response dicts can carry datetime
+    objects without Python-level isoformat() calls.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize obj to a JSON string."""
+        return orjson.dumps(obj, default=str, option=_ORJSON_OPTIONS).decode()
+
+    def loads(self, s: "str | bytes", **kwargs: Any) -> Any:
+        """Deserialize JSON from a string or bytes."""
+        return orjson.loads(s)
+
 
 # Initialize Flask app
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 CORS(app)
 
 # Database configuration
@@ -22,29 +50,109 @@ DATABASE_URL = os.getenv(
 app.config["SQLALCHEMY_DATABASE_URI"] = DATABASE_URL
 app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
 
+# Engine tuning for the real (Postgres) database: a pool sized for the
+# gunicorn worker/thread layout so requests don't queue on connection
+# acquire, pre-ping to silently replace connections dropped by network
+# blips, and periodic recycling to stay ahead of server-side timeouts.
+# The SQLite test engine uses pool classes that reject these options.
+if DATABASE_URL.startswith("postgresql"):
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+        "pool_size": 20,
+        "max_overflow": 10,
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+    }
+
 # Initialize database
 db.init_app(app)
 
 
+# ============================================================================
+# Helpers
+# ============================================================================
+
+
+def _load_owned_rca(rca_id: int, user_id: int) -> "Rca | tuple[dict, int]":
+    """Fetch an RCA with ownership enforced in the query itself.
+
+    Returns the RCA, or an (error body, status) response tuple the
+    route can return as-is. Only on a miss does a second lookup run, to
+    keep the distinct 404 vs 403 responses.
+    """
+    rca = Rca.get_owned(rca_id, user_id)
+    if rca is not None:
+        return rca
+    if db.session.get(Rca, rca_id) is None:
+        return {"error": "RCA not found"}, 404
+    return {"error": "Unauthorized"}, 403
+
+
+def _stream_rca_tree(rca: Rca) -> "Iterator[bytes]":
+    """Stream the RCA-with-tree payload as JSON fragments.
+
+    Serializes each node once, straight from the grouped flat rows, so
+    large trees never exist as a nested dict + encoded string at the
+    same time.
+    """
+    rows_by_parent = WhyNode.fetch_rows(rca.id)
+
+    def emit(node: "dict[str, Any]") -> "Iterator[bytes]":
+        fragment = orjson.dumps(node, option=_ORJSON_OPTIONS)
+        # Reopen the node object to append its children array
+        yield fragment[:-1] + b',"children":['
+        for i, child in enumerate(rows_by_parent.get(node["id"], [])):
+            if i:
+                yield b","
+            yield from emit(child)
+        yield b"]}"
+
+    head = orjson.dumps(rca.to_dict(), option=_ORJSON_OPTIONS)
+    yield b'{"rca":' + head[:-1] + b',"nodes":['
+    for i, node in enumerate(rows_by_parent.get(None, [])):
+        if i:
+            yield b","
+        yield from emit(node)
+    yield b"]}}"
+
+
+def _load_owned_node(node_id: int, user_id: int) -> "WhyNode | tuple[dict, int]":
+    """Fetch a why node with ownership enforced via a JOIN to rcas.
+
+    Returns the node, or an (error body, status) response tuple;
+    mirrors _load_owned_rca on a miss.
+    """
+    node = WhyNode.get_owned(node_id, user_id)
+    if node is not None:
+        return node
+    if db.session.get(WhyNode, node_id) is None:
+        return {"error": "Node not found"}, 404
+    return {"error": "Unauthorized"}, 403
+
+
 # ============================================================================
 # Authentication Endpoints
 # ============================================================================
 
 
 @app.route("/api/auth/register", methods=["POST"])
-@validate_request_json(["email", "username", "password"])
+@validate_request_json
 def register() -> tuple[dict, int]:
     """Register a new user."""
     try:
-        data = RegisterRequest(**request.get_json())
+        data = REGISTER_ADAPTER.validate_json(request.get_data(cache=False))
     except ValidationError as e:
         return {"error": e.errors()}, 400
 
-    # Check if user already exists
-    if User.query.filter_by(email=data.email).first():
+    # Check both identifiers for conflicts in a single query
+    existing = db.session.execute(
+        db.select(User.email, User.username).where(
+            db.or_(User.email == data.email, User.username == data.username)
+        )
+    ).all()
+    if any(row.email == data.email for row in existing):
         return {"error": "Email already registered"}, 400
 
-    if User.query.filter_by(username=data.username).first():
+    if any(row.username == data.username for row in existing):
         return {"error": "Username already taken"}, 400
 
     # Create new user
@@ -52,7 +160,13 @@ def register() -> tuple[dict, int]:
     user.set_password(data.password)
 
     db.session.add(user)
-    db.session.commit()
+    try:
+        db.session.commit()
+    except IntegrityError:
+        # Concurrent registrations and case-variant duplicates get past
+        # the friendly pre-check; the unique indexes are the backstop.
+        db.session.rollback()
+        return {"error": "Email or username already registered"}, 400
 
     # Generate token
     token = generate_token(user.id)
@@ -65,11 +179,11 @@ def register() -> tuple[dict, int]:
 
 
 @app.route("/api/auth/login", methods=["POST"])
-@validate_request_json(["email", "password"])
+@validate_request_json
 def login() -> tuple[dict, int]:
     """Login user."""
     try:
-        data = LoginRequest(**request.get_json())
+        data = LOGIN_ADAPTER.validate_json(request.get_data(cache=False))
     except ValidationError as e:
         return {"error": e.errors()}, 400
 
@@ -88,9 +202,12 @@ def login() -> tuple[dict, int]:
 
 @app.route("/api/auth/me", methods=["GET"])
 @login_required
-def get_current_user_info(current_user: User) -> tuple[dict, int]:
+def get_current_user_info(current_user_id: int) -> tuple[dict, int]:
     """Get current user information."""
-    return {"user": current_user.to_dict(include_email=True)}, 200
+    user = db.session.get(User, current_user_id)
+    if not user:
+        return {"error": "Authentication required"}, 401
+    return {"user": user.to_dict(include_email=True)}, 200
 
 
 # ============================================================================
@@ -100,23 +217,57 @@ def get_current_user_info(current_user: User) -> tuple[dict, int]:
 
 @app.route("/api/rcas", methods=["GET"])
 @login_required
-def get_rcas(current_user: User) -> tuple[dict, int]:
-    """Get all RCAs for the current user."""
-    rcas = (
-        Rca.query.filter_by(owner_id=current_user.id)
-        .order_by(Rca.created_at.desc())
-        .all()
-    )
-    return {"rcas": [rca.to_dict() for rca in rcas]}, 200
+def get_rcas(current_user_id: int) -> tuple[dict, int]:
+    """Get RCAs for the current user, newest first, keyset-paginated.
+
+    Accepts ?limit= (default 50, max 200) and ?cursor= (opaque, from a
+    previous response's next_cursor). Keyset pagination on
+    (created_at, id) keeps each page a bounded index range scan, unlike
+    OFFSET which re-reads all skipped rows.
+    """
+    try:
+        limit = min(max(int(request.args.get("limit", 50)), 1), 200)
+    except ValueError:
+        return {"error": "Invalid limit"}, 400
+
+    query = Rca.query.filter_by(owner_id=current_user_id)
+
+    cursor = request.args.get("cursor")
+    if cursor:
+        try:
+            raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+            created_str, _, id_str = raw.rpartition("|")
+            cursor_created = datetime.fromisoformat(created_str)
+            cursor_id = int(id_str)
+        except (ValueError, UnicodeDecodeError):
+            return {"error": "Invalid cursor"}, 400
+        query = query.filter(
+            db.or_(
+                Rca.created_at < cursor_created,
+                db.and_(Rca.created_at == cursor_created, Rca.id < cursor_id),
+            )
+        )
+
+    # Fetch one extra row to know whether another page exists
+    rcas = query.order_by(Rca.created_at.desc(), Rca.id.desc()).limit(limit + 1).all()
+    next_cursor = None
+    if len(rcas) > limit:
+        rcas = rcas[:limit]
+        last = rcas[-1]
+        next_cursor = base64.urlsafe_b64encode(
+            f"{last.created_at.isoformat()}|{last.id}".encode()
+        ).decode()
+
+    return {"rcas": [rca.to_dict() for rca in rcas], "next_cursor": next_cursor}, 200
 
 
 @app.route("/api/rcas", methods=["POST"])
 @login_required
-@validate_request_json(["name"])
-def create_rca(current_user: User) -> tuple[dict, int]:
+@validate_request_json
+def create_rca(current_user_id: int) -> tuple[dict, int]:
     """Create a new RCA."""
     try:
-        data = RcaCreateRequest(**request.get_json())
+        data = RCA_CREATE_ADAPTER.validate_json(request.get_data(cache=False))
     except ValidationError as e:
         return {"error": e.errors()}, 400
 
@@ -124,7 +275,7 @@ def create_rca(current_user: User) -> tuple[dict, int]:
         name=data.name,
         description=data.description,
         timeline=data.timeline,
-        owner_id=current_user.id,
+        owner_id=current_user_id,
     )
     db.session.add(rca)
     db.session.commit()
@@ -134,31 +285,28 @@ def create_rca(current_user: User) -> tuple[dict, int]:
 
 @app.route("/api/rcas/<int:rca_id>", methods=["GET"])
 @login_required
-def get_rca(rca_id: int, current_user: User) -> tuple[dict, int]:
-    """Get a specific RCA with full why tree."""
-    rca = db.session.get(Rca, rca_id)
-    if not rca:
-        return {"error": "RCA not found"}, 404
-
-    if rca.owner_id != current_user.id:
-        return {"error": "Unauthorized"}, 403
-
-    return {"rca": rca.to_dict_with_tree()}, 200
+def get_rca(rca_id: int, current_user_id: int) -> "Response | tuple[dict, int]":
+    """Get a specific RCA with full why tree, streamed."""
+    rca = _load_owned_rca(rca_id, current_user_id)
+    if isinstance(rca, tuple):
+        return rca
+
+    return Response(
+        stream_with_context(_stream_rca_tree(rca)), mimetype="application/json"
+    )
 
 
 @app.route("/api/rcas/<int:rca_id>", methods=["PATCH"])
 @login_required
-def update_rca(rca_id: int, current_user: User) -> tuple[dict, int]:
+@validate_request_json
+def update_rca(rca_id: int, current_user_id: int) -> tuple[dict, int]:
     """Update an RCA."""
-    rca = db.session.get(Rca, rca_id)
-    if not rca:
-        return {"error": "RCA not found"}, 404
-
-    if rca.owner_id != current_user.id:
-        return {"error": "Unauthorized"}, 403
+    rca = _load_owned_rca(rca_id, current_user_id)
+    if isinstance(rca, tuple):
+        return rca
 
     try:
-        data = RcaUpdateRequest(**request.get_json())
+        data = RCA_UPDATE_ADAPTER.validate_json(request.get_data(cache=False))
     except ValidationError as e:
         return {"error": e.errors()}, 400
 
@@ -176,14 +324,11 @@ def update_rca(rca_id: int, current_user: User) -> tuple[dict, int]:
 
 @app.route("/api/rcas/<int:rca_id>", methods=["DELETE"])
 @login_required
-def delete_rca(rca_id: int, current_user: User) -> tuple[dict, int]:
+def delete_rca(rca_id: int, current_user_id: int) -> tuple[dict, int]:
     """Delete an RCA (cascades nodes)."""
-    rca = db.session.get(Rca, rca_id)
-    if not rca:
-        return {"error": "RCA not found"}, 404
-
-    if rca.owner_id != current_user.id:
-        return {"error": "Unauthorized"}, 403
+    rca = _load_owned_rca(rca_id, current_user_id)
+    if isinstance(rca, tuple):
+        return rca
 
     db.session.delete(rca)
     db.session.commit()
@@ -198,18 +343,15 @@ def delete_rca(rca_id: int, current_user: User) -> tuple[dict, int]:
 
 @app.route("/api/rcas/<int:rca_id>/nodes", methods=["POST"])
 @login_required
-@validate_request_json(["content"])
-def create_node(rca_id: int, current_user: User) -> tuple[dict, int]:
+@validate_request_json
+def create_node(rca_id: int, current_user_id: int) -> tuple[dict, int]:
     """Add a why/root-cause node to an RCA."""
-    rca = db.session.get(Rca, rca_id)
-    if not rca:
-        return {"error": "RCA not found"}, 404
-
-    if rca.owner_id != current_user.id:
-        return {"error": "Unauthorized"}, 403
+    rca = _load_owned_rca(rca_id, current_user_id)
+    if isinstance(rca, tuple):
+        return rca
 
     try:
-        data = WhyNodeCreateRequest(**request.get_json())
+        data = WHY_NODE_CREATE_ADAPTER.validate_json(request.get_data(cache=False))
     except ValidationError as e:
         return {"error": e.errors()}, 400
 
@@ -223,40 +365,112 @@ def create_node(rca_id: int, current_user: User) -> tuple[dict, int]:
         if not parent or parent.rca_id != rca_id:
             return {"error": "Parent node not found in this RCA"}, 404
 
-    # Calculate order for new node
-    if data.parent_id is None:
-        sibling_count = WhyNode.query.filter_by(rca_id=rca_id, parent_id=None).count()
-    else:
-        sibling_count = WhyNode.query.filter_by(
-            rca_id=rca_id, parent_id=data.parent_id
-        ).count()
-
-    node = WhyNode(
-        rca_id=rca_id,
-        parent_id=data.parent_id,
-        node_type=data.node_type,
-        content=data.content,
-        order=sibling_count,
+    # Order after existing siblings, computed in the INSERT itself so the
+    # whole create is a single round-trip (MAX also stays correct after
+    # sibling deletions, unlike a COUNT).
+    next_order = (
+        db.select(db.func.coalesce(db.func.max(WhyNode.order), -1) + 1)
+        .where(
+            WhyNode.rca_id == rca_id,
+            WhyNode.parent_id.is_(None)
+            if data.parent_id is None
+            else WhyNode.parent_id == data.parent_id,
+        )
+        .scalar_subquery()
     )
-    db.session.add(node)
+    node = db.session.execute(
+        db.insert(WhyNode)
+        .values(
+            rca_id=rca_id,
+            parent_id=data.parent_id,
+            node_type=data.node_type,
+            content=data.content,
+            order=next_order,
+        )
+        .returning(WhyNode)
+    ).scalar_one()
     db.session.commit()
 
     return {"node": node.to_dict()}, 201
 
 
+@app.route("/api/rcas/<int:rca_id>/nodes/bulk", methods=["POST"])
+@login_required
+@validate_request_json
+def create_nodes_bulk(rca_id: int, current_user_id: int) -> tuple[dict, int]:
+    """Add several why/root-cause nodes to an RCA in one INSERT.
+
+    Parents must already exist; references between nodes in the same
+    batch are not supported.
+    """
+    rca = _load_owned_rca(rca_id, current_user_id)
+    if isinstance(rca, tuple):
+        return rca
+
+    try:
+        data = WHY_NODE_BULK_CREATE_ADAPTER.validate_json(
+            request.get_data(cache=False)
+        )
+    except ValidationError as e:
+        return {"error": e.errors()}, 400
+
+    for item in data.nodes:
+        if item.parent_id is None and item.node_type != "why":
+            return {"error": "Top-level nodes must be of type 'why'"}, 400
+
+    # Validate all parents in one query
+    parent_ids = {item.parent_id for item in data.nodes if item.parent_id is not None}
+    if parent_ids:
+        found = set(
+            db.session.execute(
+                db.select(WhyNode.id).where(
+                    WhyNode.rca_id == rca_id, WhyNode.id.in_(parent_ids)
+                )
+            ).scalars()
+        )
+        if parent_ids - found:
+            return {"error": "Parent node not found in this RCA"}, 404
+
+    # Next order per parent, from one grouped aggregate over the RCA
+    next_order = {
+        parent_id: max_order + 1
+        for parent_id, max_order in db.session.execute(
+            db.select(WhyNode.parent_id, db.func.max(WhyNode.order))
+            .where(WhyNode.rca_id == rca_id)
+            .group_by(WhyNode.parent_id)
+        ).all()
+    }
+    rows = []
+    for item in data.nodes:
+        order = next_order.get(item.parent_id, 0)
+        next_order[item.parent_id] = order + 1
+        rows.append(
+            {
+                "rca_id": rca_id,
+                "parent_id": item.parent_id,
+                "node_type": item.node_type,
+                "content": item.content,
+                "order": order,
+            }
+        )
+
+    nodes = WhyNode.bulk_create(rows)
+    db.session.commit()
+
+    return {"nodes": [node.to_dict() for node in nodes]}, 201
+
+
 @app.route("/api/nodes/<int:node_id>", methods=["PATCH"])
 @login_required
-def update_node(node_id: int, current_user: User) -> tuple[dict, int]:
+@validate_request_json
+def update_node(node_id: int, current_user_id: int) -> tuple[dict, int]:
     """Update a why node's content or type."""
-    node = db.session.get(WhyNode, node_id)
-    if not node:
-        return {"error": "Node not found"}, 404
-
-    if node.rca.owner_id != current_user.id:
-        return {"error": "Unauthorized"}, 403
+    node = _load_owned_node(node_id, current_user_id)
+    if isinstance(node, tuple):
+        return node
 
     try:
-        data = WhyNodeUpdateRequest(**request.get_json())
+        data = WHY_NODE_UPDATE_ADAPTER.validate_json(request.get_data(cache=False))
     except ValidationError as e:
         return {"error": e.errors()}, 400
 
@@ -275,14 +489,11 @@ def update_node(node_id: int, current_user: User) -> tuple[dict, int]:
 
 @app.route("/api/nodes/<int:node_id>", methods=["DELETE"])
 @login_required
-def delete_node(node_id: int, current_user: User) -> tuple[dict, int]:
+def delete_node(node_id: int, current_user_id: int) -> tuple[dict, int]:
     """Delete a why node (cascades children)."""
-    node = db.session.get(WhyNode, node_id)
-    if not node:
-        return {"error": "Node not found"}, 404
-
-    if node.rca.owner_id != current_user.id:
-        return {"error": "Unauthorized"}, 403
+    node = _load_owned_node(node_id, current_user_id)
+    if isinstance(node, tuple):
+        return node
 
     db.session.delete(node)
     db.session.commit()
@@ -0,0 +1,24 @@
+"""Gunicorn configuration for the production server.
+
+The API is I/O-bound (database round-trips) with occasional CPU-heavy
+calls (password hashing on login), so run several worker processes with
+a thread pool each: threads keep requests multiplexed while a worker is
+blocked on the database, and extra processes keep one slow hash from
+serializing everything else.
+"""
+import multiprocessing
+
+bind = "0.0.0.0:5000"
+
+workers = multiprocessing.cpu_count() * 2 + 1
+worker_class = "gthread"
+threads = 4
+
+# Import the app before forking so workers share the loaded code pages.
+preload_app = True
+
+timeout = 30
+keepalive = 5
+
+accesslog = "-"
+errorlog = "-"
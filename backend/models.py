@@ -1,12 +1,20 @@
 """Database models for the RCA (Root Cause Analysis) tool."""
+import os
 from datetime import datetime, timezone
-from typing import Any, Dict, List, cast
+from typing import Any, Dict, List, Optional, cast
 
 from flask_sqlalchemy import SQLAlchemy
 from werkzeug.security import check_password_hash, generate_password_hash
 
 db = SQLAlchemy()
 
+# KDF used for new password hashes. Werkzeug's scrypt default costs
+# ~100ms of CPU per call, which is right for production but drags in
+# dev/test environments; override with e.g. "pbkdf2:sha256:1000" there.
+# Verification reads the method from the stored hash, so existing hashes
+# keep working whatever this is set to.
+PASSWORD_HASH_METHOD = os.getenv("PASSWORD_HASH_METHOD", "scrypt:32768:8:1")
+
 
 class User(db.Model):  # type: ignore  # db.Model lacks type stubs
     """User model for authentication and profile management."""
@@ -34,7 +42,9 @@ class User(db.Model):  # type: ignore  # db.Model lacks type stubs
 
     def set_password(self, password: str) -> None:
         """Hash and set user password."""
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = generate_password_hash(
+            password, method=PASSWORD_HASH_METHOD
+        )
 
     def check_password(self, password: str) -> bool:
         """Check if provided password matches hash."""
@@ -45,17 +55,28 @@ class User(db.Model):  # type: ignore  # db.Model lacks type stubs
         data: Dict[str, Any] = {
             "id": self.id,
             "username": self.username,
-            "created_at": self.created_at.isoformat(),
+            "created_at": self.created_at,
         }
         if include_email:
             data["email"] = self.email
         return data
 
 
+# Case-insensitive uniqueness for the auth identifiers, enforced in the
+# database; the functional indexes also make lower()-based lookups
+# index-backed instead of full scans.
+db.Index("ix_users_email_lower", db.func.lower(User.email), unique=True)
+db.Index("ix_users_username_lower", db.func.lower(User.username), unique=True)
+
+
 class Rca(db.Model):  # type: ignore  # db.Model lacks type stubs
     """Root Cause Analysis model."""
 
     __tablename__ = "rcas"
+    __table_args__ = (
+        # Supports the keyset-paginated newest-first listing per owner
+        db.Index("ix_rcas_owner_created_id", "owner_id", "created_at", "id"),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(200), nullable=False)
@@ -73,6 +94,9 @@ class Rca(db.Model):  # type: ignore  # db.Model lacks type stubs
     )
 
     owner = cast("User", db.relationship("User", back_populates="rcas"))
+    # Deliberately lazy: the read paths (fetch_rows CTE, paginated
+    # listing) never traverse this relationship, and eager-loading it
+    # would re-fetch every node as an ORM entity alongside them.
     nodes = cast(
         List["WhyNode"],
         db.relationship(
@@ -83,6 +107,17 @@ class Rca(db.Model):  # type: ignore  # db.Model lacks type stubs
         ),
     )
 
+    @classmethod
+    def get_owned(cls, rca_id: int, user_id: int) -> Optional["Rca"]:
+        """Fetch an RCA only if it is owned by the given user.
+
+        Folds the ownership check into the lookup so the common
+        (authorized) path costs a single query.
+        """
+        return db.session.execute(
+            db.select(cls).where(cls.id == rca_id, cls.owner_id == user_id)
+        ).scalar_one_or_none()
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert RCA to dictionary (without nodes)."""
         return {
@@ -91,18 +126,19 @@ class Rca(db.Model):  # type: ignore  # db.Model lacks type stubs
             "description": self.description,
             "timeline": self.timeline,
             "owner": self.owner.to_dict() if self.owner else None,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
         }
 
     def to_dict_with_tree(self) -> Dict[str, Any]:
-        """Convert RCA to dictionary with full why-node tree."""
+        """Convert RCA to dictionary with full why-node tree.
+
+        Fetches all nodes in a single query and assembles the tree in
+        memory, avoiding the per-node SELECTs that lazy-loading
+        ``children`` relationships would issue.
+        """
         data = self.to_dict()
-        # Build tree from flat list
-        top_level = [n for n in self.nodes if n.parent_id is None]
-        data["nodes"] = [
-            n.to_tree_dict() for n in sorted(top_level, key=lambda n: n.order)
-        ]
+        data["nodes"] = WhyNode.fetch_tree(self.id)
         return data
 
 
@@ -110,6 +146,9 @@ class WhyNode(db.Model):  # type: ignore  # db.Model lacks type stubs
     """A node in the 5 Whys tree."""
 
     __tablename__ = "why_nodes"
+    __table_args__ = (
+        db.Index("ix_why_nodes_rca_parent_order", "rca_id", "parent_id", "order"),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     rca_id = db.Column(db.Integer, db.ForeignKey("rcas.id"), nullable=False)
@@ -135,9 +174,101 @@ class WhyNode(db.Model):  # type: ignore  # db.Model lacks type stubs
             backref=db.backref("parent", remote_side="WhyNode.id"),
             cascade="all, delete-orphan",
             order_by="WhyNode.order",
+            lazy="selectin",
         ),
     )
 
+    @classmethod
+    def bulk_create(cls, rows: List[Dict[str, Any]]) -> List["WhyNode"]:
+        """Insert many nodes in one statement and return them.
+
+        Uses an executemany INSERT ... RETURNING instead of per-row ORM
+        adds, skipping the unit-of-work bookkeeping each row would pay.
+        sort_by_parameter_order guarantees the returned nodes line up
+        with the input rows on every backend. Does not commit; callers
+        own the transaction.
+        """
+        return list(
+            db.session.execute(
+                db.insert(cls).returning(cls, sort_by_parameter_order=True), rows
+            )
+            .scalars()
+            .all()
+        )
+
+    @classmethod
+    def get_owned(cls, node_id: int, user_id: int) -> Optional["WhyNode"]:
+        """Fetch a node only if its RCA is owned by the given user.
+
+        Joins through rcas so the authorized path is one query instead
+        of a node fetch plus a lazy node.rca load.
+        """
+        return db.session.execute(
+            db.select(cls).join(Rca).where(cls.id == node_id, Rca.owner_id == user_id)
+        ).scalar_one_or_none()
+
+    @classmethod
+    def fetch_rows(cls, rca_id: int) -> Dict[Optional[int], List[Dict[str, Any]]]:
+        """Fetch all nodes for an RCA as flat dicts grouped by parent_id.
+
+        A recursive CTE returns the entire tree in a single round-trip,
+        and rows are read as plain column tuples — no ORM entities are
+        materialized, so the hot /api/rcas/<id> path pays no
+        identity-map or attribute-descriptor overhead per node. Callers
+        nest or stream the grouped rows as needed; children lists are in
+        sibling order.
+        """
+        tree = (
+            db.select(cls, db.literal(0).label("depth"))
+            .where(cls.rca_id == rca_id, cls.parent_id.is_(None))
+            .cte("why_tree", recursive=True)
+        )
+        child = db.aliased(cls)
+        tree = tree.union_all(
+            db.select(child, tree.c.depth + 1).where(child.parent_id == tree.c.id)
+        )
+        rows = db.session.execute(
+            db.select(
+                tree.c.id,
+                tree.c.rca_id,
+                tree.c.parent_id,
+                tree.c.node_type,
+                tree.c.content,
+                tree.c.order,
+                tree.c.created_at,
+                tree.c.updated_at,
+            ).order_by(tree.c.depth, tree.c.parent_id, tree.c.order)
+        ).all()
+
+        rows_by_parent: Dict[Optional[int], List[Dict[str, Any]]] = {}
+        for row in rows:
+            rows_by_parent.setdefault(row.parent_id, []).append(
+                {
+                    "id": row.id,
+                    "rca_id": row.rca_id,
+                    "parent_id": row.parent_id,
+                    "node_type": row.node_type,
+                    "content": row.content,
+                    "order": row.order,
+                    "created_at": row.created_at,
+                    "updated_at": row.updated_at,
+                }
+            )
+        return rows_by_parent
+
+    @classmethod
+    def fetch_tree(cls, rca_id: int) -> List[Dict[str, Any]]:
+        """Fetch the full why tree for an RCA as nested dicts."""
+        rows_by_parent = cls.fetch_rows(rca_id)
+
+        def attach(node_data: Dict[str, Any]) -> Dict[str, Any]:
+            node_data["children"] = [
+                attach(c) for c in rows_by_parent.get(node_data["id"], [])
+            ]
+            return node_data
+
+        return [attach(n) for n in rows_by_parent.get(None, [])]
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert node to flat dictionary."""
         return {
@@ -147,8 +278,8 @@ class WhyNode(db.Model):  # type: ignore  # db.Model lacks type stubs
             "node_type": self.node_type,
             "content": self.content,
             "order": self.order,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
         }
 
     def to_tree_dict(self) -> Dict[str, Any]:
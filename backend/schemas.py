@@ -1,31 +1,31 @@
 """Pydantic schemas for request/response validation."""
-from typing import Optional
+from typing import Annotated, Optional
 
-from pydantic import BaseModel, EmailStr, Field, field_validator
+from pydantic import BaseModel, Field, StringConstraints, TypeAdapter
+
+# Shape check for emails, compiled once into the schema cores and run in
+# Rust by pydantic-core — no email-validator/IDNA machinery per request.
+# Case-insensitive uniqueness is enforced by the database indexes.
+Email = Annotated[str, StringConstraints(pattern=r"^[^@\s]+@[^@\s]+\.[^@\s]+$")]
 
 
 class RegisterRequest(BaseModel):
     """Schema for user registration."""
 
-    email: EmailStr
-    username: str = Field(min_length=3, max_length=120)
+    email: Email
+    # Alphanumeric plus underscore/hyphen, checked by pydantic-core in
+    # one compiled-pattern scan rather than a Python validator callback
+    username: Annotated[
+        str,
+        StringConstraints(pattern=r"^[A-Za-z0-9_-]+$", min_length=3, max_length=120),
+    ]
     password: str = Field(min_length=8)
 
-    @field_validator("username")
-    @classmethod
-    def username_alphanumeric(cls, v: str) -> str:
-        """Validate username is alphanumeric."""
-        if not v.replace("_", "").replace("-", "").isalnum():
-            raise ValueError(
-                "Username must be alphanumeric (underscores and hyphens allowed)"
-            )
-        return v
-
 
 class LoginRequest(BaseModel):
     """Schema for user login."""
 
-    email: EmailStr
+    email: Email
     password: str
 
 
@@ -53,8 +53,31 @@ class WhyNodeCreateRequest(BaseModel):
     content: str = Field(min_length=1)
 
 
+class WhyNodeBulkCreateRequest(BaseModel):
+    """Schema for creating several why nodes in one request."""
+
+    nodes: list[WhyNodeCreateRequest] = Field(min_length=1, max_length=500)
+
+
 class WhyNodeUpdateRequest(BaseModel):
     """Schema for updating a why node."""
 
     content: Optional[str] = Field(None, min_length=1)
     node_type: Optional[str] = Field(None, pattern="^(why|root_cause)$")
+
+
+# Validator cores are built once at import time and reused for every
+# request; routes feed raw body bytes straight to validate_json().
+REGISTER_ADAPTER: TypeAdapter[RegisterRequest] = TypeAdapter(RegisterRequest)
+LOGIN_ADAPTER: TypeAdapter[LoginRequest] = TypeAdapter(LoginRequest)
+RCA_CREATE_ADAPTER: TypeAdapter[RcaCreateRequest] = TypeAdapter(RcaCreateRequest)
+RCA_UPDATE_ADAPTER: TypeAdapter[RcaUpdateRequest] = TypeAdapter(RcaUpdateRequest)
+WHY_NODE_CREATE_ADAPTER: TypeAdapter[WhyNodeCreateRequest] = TypeAdapter(
+    WhyNodeCreateRequest
+)
+WHY_NODE_BULK_CREATE_ADAPTER: TypeAdapter[WhyNodeBulkCreateRequest] = TypeAdapter(
+    WhyNodeBulkCreateRequest
+)
+WHY_NODE_UPDATE_ADAPTER: TypeAdapter[WhyNodeUpdateRequest] = TypeAdapter(
+    WhyNodeUpdateRequest
+)
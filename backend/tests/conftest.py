@@ -9,6 +9,8 @@ from flask.testing import FlaskClient
 # Set test environment before importing app
 os.environ["DATABASE_URL"] = "sqlite:///:memory:"
 os.environ["SECRET_KEY"] = "test-secret-key"
+# Cheap KDF so password-hashing tests don't pay production scrypt cost
+os.environ["PASSWORD_HASH_METHOD"] = "pbkdf2:sha256:1000"
 
 from api import \
     app as \
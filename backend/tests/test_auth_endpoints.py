@@ -131,3 +131,17 @@ def test_get_current_user(client, auth_headers, sample_user):
     data = response.get_json()
     assert data["user"]["email"] == sample_user.email
     assert data["user"]["username"] == sample_user.username
+
+
+def test_register_duplicate_email_case_insensitive(client, sample_user):
+    """Test registration with a case-variant of an existing email fails."""
+    response = client.post(
+        "/api/auth/register",
+        json={
+            "email": sample_user.email.upper(),
+            "username": "different",
+            "password": "password123",
+        },
+    )
+    assert response.status_code == 400
+    assert "already registered" in response.get_json()["error"]
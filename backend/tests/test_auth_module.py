@@ -128,29 +128,18 @@ def test_validate_request_json_decorator(app: Flask) -> None:
     test_app = FlaskApp(__name__)
 
     @test_app.route("/test-validate", methods=["POST"])
-    @validate_request_json(["field1", "field2"])
+    @validate_request_json
     def test_route() -> Tuple[Any, int]:
         return jsonify({"message": "success"}), 200
 
     test_client = test_app.test_client()
 
-    # Test with valid data
-    response = test_client.post(
-        "/test-validate", json={"field1": "value1", "field2": "value2"}
-    )
-    assert response.status_code == 200
-
-    # Test with missing field
+    # Test with a JSON body
     response = test_client.post("/test-validate", json={"field1": "value1"})
-    assert response.status_code == 400
-    assert "Missing required fields: field2" in response.get_json()["error"]
+    assert response.status_code == 200
 
-    # Test with no JSON
+    # Test with no JSON content type - field presence is the Pydantic
+    # schema's job now, the decorator only guards the content type
     response = test_client.post("/test-validate", data="not json")
     assert response.status_code == 400
-
-    # Test with empty body - Flask returns 400 for empty JSON
-    response = test_client.post(
-        "/test-validate", headers={"Content-Type": "application/json"}, data=""
-    )
-    assert response.status_code == 400
+    assert "Content-Type" in response.get_json()["error"]
@@ -106,3 +106,36 @@ def test_rca_validation_error(client, auth_headers, sample_user):
         headers=auth_headers,
     )
     assert response.status_code == 400
+
+
+def test_get_rcas_pagination(client, auth_headers, sample_user, db_session):
+    """Test keyset pagination over the RCA listing."""
+    for i in range(5):
+        db_session.add(Rca(name=f"RCA {i}", owner_id=sample_user.id))
+    db_session.commit()
+
+    response = client.get("/api/rcas?limit=2", headers=auth_headers)
+    assert response.status_code == 200
+    data = response.get_json()
+    assert len(data["rcas"]) == 2
+    assert data["next_cursor"] is not None
+
+    seen = [rca["id"] for rca in data["rcas"]]
+    while data["next_cursor"]:
+        response = client.get(
+            f"/api/rcas?limit=2&cursor={data['next_cursor']}",
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        data = response.get_json()
+        seen.extend(rca["id"] for rca in data["rcas"])
+
+    # All five RCAs seen exactly once, newest first
+    assert len(seen) == 5
+    assert seen == sorted(seen, reverse=True)
+
+
+def test_get_rcas_invalid_cursor(client, auth_headers, sample_user):
+    """Test that a malformed cursor is rejected."""
+    response = client.get("/api/rcas?cursor=notacursor", headers=auth_headers)
+    assert response.status_code == 400
@@ -189,3 +189,68 @@ def test_get_rca_tree_structure(client, auth_headers, sample_user, db_session):
     assert nodes[0]["content"] == "Why 1"
     assert len(nodes[0]["children"]) == 1
     assert nodes[0]["children"][0]["content"] == "Because X"
+
+
+def test_bulk_create_nodes(client, auth_headers, sample_user, db_session):
+    """Test creating several nodes in one request."""
+    rca = Rca(name="Bulk RCA", owner_id=sample_user.id)
+    db_session.add(rca)
+    db_session.commit()
+
+    parent = WhyNode(rca_id=rca.id, content="Crashed", node_type="why", order=0)
+    db_session.add(parent)
+    db_session.commit()
+
+    response = client.post(
+        f"/api/rcas/{rca.id}/nodes/bulk",
+        json={
+            "nodes": [
+                {"content": "Why 2", "node_type": "why"},
+                {"content": "Because X", "node_type": "why", "parent_id": parent.id},
+                {"content": "Because Y", "node_type": "why", "parent_id": parent.id},
+            ]
+        },
+        headers=auth_headers,
+    )
+    assert response.status_code == 201
+    data = response.get_json()
+    assert len(data["nodes"]) == 3
+    # Top-level node orders after the existing one
+    assert data["nodes"][0]["order"] == 1
+    # Children of the same parent get consecutive orders
+    assert [n["order"] for n in data["nodes"][1:]] == [0, 1]
+
+
+def test_bulk_create_nodes_bad_parent(client, auth_headers, sample_user, db_session):
+    """Test bulk create with a parent from another RCA fails."""
+    rca = Rca(name="Bulk RCA", owner_id=sample_user.id)
+    other = Rca(name="Other RCA", owner_id=sample_user.id)
+    db_session.add_all([rca, other])
+    db_session.commit()
+
+    foreign = WhyNode(rca_id=other.id, content="Elsewhere", node_type="why", order=0)
+    db_session.add(foreign)
+    db_session.commit()
+
+    response = client.post(
+        f"/api/rcas/{rca.id}/nodes/bulk",
+        json={"nodes": [{"content": "Bad", "parent_id": foreign.id}]},
+        headers=auth_headers,
+    )
+    assert response.status_code == 404
+
+
+def test_bulk_create_nodes_top_level_must_be_why(
+    client, auth_headers, sample_user, db_session
+):
+    """Test bulk create rejects top-level root_cause nodes."""
+    rca = Rca(name="Bulk RCA", owner_id=sample_user.id)
+    db_session.add(rca)
+    db_session.commit()
+
+    response = client.post(
+        f"/api/rcas/{rca.id}/nodes/bulk",
+        json={"nodes": [{"content": "Bad", "node_type": "root_cause"}]},
+        headers=auth_headers,
+    )
+    assert response.status_code == 400
@@ -173,6 +173,30 @@ describe("ApiClient", () => {
       const result = await client.getRcas();
       expect(result).toEqual(mockRcas);
     });
+
+    it("follows next_cursor across pages", async () => {
+      const page1 = [{ id: 3, name: "RCA 3" }];
+      const page2 = [{ id: 2, name: "RCA 2" }];
+
+      mockFetch
+        .mockResolvedValueOnce({
+          ok: true,
+          json: async () => ({ rcas: page1, next_cursor: "abc123" }),
+        } as Response)
+        .mockResolvedValueOnce({
+          ok: true,
+          json: async () => ({ rcas: page2, next_cursor: null }),
+        } as Response);
+
+      const result = await client.getRcas();
+
+      expect(result).toEqual([...page1, ...page2]);
+      expect(mockFetch).toHaveBeenNthCalledWith(
+        2,
+        "http://test-api.com/api/rcas?cursor=abc123",
+        expect.anything()
+      );
+    });
   });
 
   describe("createRca", () => {
@@ -8,6 +8,7 @@ import type {
   LoginRequest,
   Rca,
   RcaCreateRequest,
+  RcasPage,
   RcaUpdateRequest,
   RegisterRequest,
   User,
@@ -114,8 +115,18 @@ export class ApiClient {
   // RCA methods
 
   public async getRcas(): Promise<Rca[]> {
-    const response = await this.request<{ rcas: Rca[] }>("/api/rcas");
-    return response.rcas;
+    // The server pages the listing with a keyset cursor; follow
+    // next_cursor until the last page so callers still get the full list.
+    const rcas: Rca[] = [];
+    let cursor: string | null = null;
+    do {
+      const query: string =
+        cursor !== null ? `?cursor=${encodeURIComponent(cursor)}` : "";
+      const response: RcasPage = await this.request<RcasPage>(`/api/rcas${query}`);
+      rcas.push(...response.rcas);
+      cursor = response.next_cursor ?? null;
+    } while (cursor !== null);
+    return rcas;
   }
 
   public async createRca(data: RcaCreateRequest): Promise<Rca> {
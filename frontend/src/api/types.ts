@@ -72,6 +72,11 @@ export interface WhyNodeUpdateRequest {
   node_type?: "why" | "root_cause";
 }
 
+export interface RcasPage {
+  rcas: Rca[];
+  next_cursor: string | null;
+}
+
 export interface ApiError {
   error: string;
   details?: unknown;